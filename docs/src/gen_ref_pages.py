@@ -3,13 +3,31 @@
 from __future__ import annotations
 
 import ast
-import importlib.util
+import functools
+import hashlib
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, List, Tuple
-import re
+from typing import IO, Iterable, List, Tuple
 import mkdocs_gen_files
 
+_join = "/".join
+_by_name = attrgetter("name")
+
+# bump to invalidate the on-disk AST cache when the parsing logic changes
+SCRIPT_VERSION = "1"
+
+# below this many uncached modules, parsing them serially is cheaper than
+# starting a process pool
+PARALLEL_MIN_MISSES = 16
+
 
 @dataclass
 class DocumentedMethod:
@@ -29,13 +47,48 @@ class DocumentedFunction:
     name: str
     signature: str
 
+@dataclass
+class WritePlan:
+    doc_path: str
+    content: str
+    edit_path: Path
+
+_SIMPLE_CONSTANT_TYPES = (type(None), bool, int)
+
+def _fast_unparse(node: ast.AST) -> str:
+    # Short-circuit the node types that make up most annotations and
+    # defaults; anything else goes through ast.unparse.
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Constant:
+        value = node.value
+        if type(value) in _SIMPLE_CONSTANT_TYPES:
+            return repr(value)
+        if type(value) is str and value.isprintable() and "'" not in value and "\\" not in value:
+            return f"'{value}'"
+    elif node_type is ast.Attribute:
+        if type(node.value) in (ast.Name, ast.Attribute):
+            return f"{_fast_unparse(node.value)}.{node.attr}"
+    elif node_type is ast.Subscript:
+        if type(node.value) in (ast.Name, ast.Attribute):
+            index = node.slice
+            if type(index) is not ast.Tuple:
+                return f"{_fast_unparse(node.value)}[{_fast_unparse(index)}]"
+            # a tuple index is written without parentheses; leave starred
+            # and empty tuples to ast.unparse
+            if index.elts and all(type(elt) is not ast.Starred for elt in index.elts):
+                index_text = ", ".join([_fast_unparse(elt) for elt in index.elts])
+                return f"{_fast_unparse(node.value)}[{index_text}]"
+    return ast.unparse(node)
+
 def _format_annotation(annotation: ast.AST | None) -> str:
     if annotation is None:
         return ""
-    return ast.unparse(annotation)
+    return _fast_unparse(annotation)
 
 def _format_default(value: ast.AST) -> str:
-    return ast.unparse(value)
+    return _fast_unparse(value)
 
 def _format_arguments(arguments: ast.arguments) -> str:
     parts: List[str] = []
@@ -93,10 +146,10 @@ def _format_function_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) ->
     return signature
 
 def _format_class_signature(node: ast.ClassDef) -> str:
-    bases = [ast.unparse(base) for base in node.bases]
+    bases = [_fast_unparse(base) for base in node.bases]
     keywords = []
     for keyword in node.keywords:
-        value = ast.unparse(keyword.value)
+        value = _fast_unparse(keyword.value)
         if keyword.arg is None:
             keywords.append(f"**{value}")
         else:
@@ -106,50 +159,151 @@ def _format_class_signature(node: ast.ClassDef) -> str:
         return f"class {node.name}({', '.join(inheritances)})"
     return f"class {node.name}"
 
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+def _handle_class(
+    node: ast.ClassDef,
+    classes: List[DocumentedClass],
+    functions: List[DocumentedFunction],
+) -> None:
+    class_doc = ast.get_docstring(node)
+    methods: List[DocumentedMethod] = []
+    init_signature: str | None = None
+    for child in node.body:
+        if type(child) not in _FUNCTION_TYPES:
+            continue
+        doc = ast.get_docstring(child)
+        is_init = child.name == "__init__"
+        if not (doc or is_init):
+            continue
+        signature = _format_function_signature(child)
+        if doc:
+            methods.append(DocumentedMethod(name=child.name, signature=signature))
+        if is_init:
+            init_signature = signature
+    methods.sort(key=_by_name)
+    if class_doc or methods:
+        classes.append(
+            DocumentedClass(
+                name=node.name,
+                has_docstring=bool(class_doc),
+                signature=_format_class_signature(node),
+                init_signature=init_signature,
+                methods=methods,
+            )
+        )
+
+def _handle_function(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    classes: List[DocumentedClass],
+    functions: List[DocumentedFunction],
+) -> None:
+    if ast.get_docstring(node):
+        functions.append(
+            DocumentedFunction(
+                name=node.name,
+                signature=_format_function_signature(node),
+            )
+        )
+
+_HANDLERS = {
+    ast.ClassDef: _handle_class,
+    ast.FunctionDef: _handle_function,
+    ast.AsyncFunctionDef: _handle_function,
+}
+
 def _get_documented_members(tree: ast.AST) -> Tuple[List[DocumentedClass], List[DocumentedFunction]]:
     classes: List[DocumentedClass] = []
     functions: List[DocumentedFunction] = []
 
     for node in getattr(tree, "body", []):
-        if isinstance(node, ast.ClassDef):
-            class_doc = ast.get_docstring(node)
-            methods: List[DocumentedMethod] = []
-            init_signature: str | None = None
-            for child in node.body:
-                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and ast.get_docstring(child):
-                    methods.append(
-                        DocumentedMethod(
-                            name=child.name,
-                            signature=_format_function_signature(child),
-                        )
-                    )
-                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and child.name == "__init__":
-                    init_signature = _format_function_signature(child)
-            methods.sort(key=lambda documented_method: documented_method.name)
-            if class_doc or methods:
-                classes.append(
-                    DocumentedClass(
-                        name=node.name,
-                        has_docstring=bool(class_doc),
-                        signature=_format_class_signature(node),
-                        init_signature=init_signature,
-                        methods=methods,
-                    )
-                )
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if ast.get_docstring(node):
-                functions.append(
-                    DocumentedFunction(
-                        name=node.name,
-                        signature=_format_function_signature(node),
-                    )
-                )
-
-    classes.sort(key=lambda documented_class: documented_class.name)
-    functions.sort(key=lambda documented_function: documented_function.name)
+        handler = _HANDLERS.get(type(node))
+        if handler is not None:
+            handler(node, classes, functions)
+
+    classes.sort(key=_by_name)
+    functions.sort(key=_by_name)
 
     return classes, functions
 
+def _walk_py(root_dir: Path) -> Iterable[os.DirEntry]:
+    stack = [str(root_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry
+
+def _cache_file(source_bytes: bytes) -> Path:
+    key = hashlib.sha256(source_bytes).hexdigest()
+    python_version = ".".join(map(str, sys.version_info[:3]))
+    return ast_cache_dir / f"{key}-py{python_version}-v{SCRIPT_VERSION}.pkl"
+
+def _load_tree(path: Path | str) -> ast.AST:
+    with open(path, "rb") as fd:
+        source_bytes = fd.read()
+    cache_file = _cache_file(source_bytes)
+    _used_cache_files.add(cache_file.name)
+    try:
+        with open(cache_file, "rb") as fd:
+            return pickle.load(fd)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    tree = ast.parse(source_bytes.decode("utf-8"))
+    try:
+        ast_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as fd:
+            pickle.dump(tree, fd, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+    return tree
+
+def _extract(path: Path) -> Tuple[List[DocumentedClass], List[DocumentedFunction]]:
+    return _get_documented_members(_load_tree(path))
+
+def _extract_all(paths: List[Path]) -> List[Tuple[List[DocumentedClass], List[DocumentedFunction]]]:
+    # mkdocs_gen_files runs this file through runpy, so the workers can only
+    # resolve _extract when they are forked from the current process. Fork
+    # is only used on Linux (unsafe on macOS) and from a single-threaded
+    # process (mkdocs serve rebuilds in a worker thread), and only when
+    # enough modules miss the AST cache to pay for the pool start-up.
+    # The cache files are recorded here because forked workers can't
+    # update _used_cache_files
+    cache_files = [_cache_file(path.read_bytes()) for path in paths]
+    _used_cache_files.update(cache_file.name for cache_file in cache_files)
+    misses = sum(not cache_file.is_file() for cache_file in cache_files)
+    if (not sys.platform.startswith("linux")
+            or threading.active_count() > 1
+            or "fork" not in multiprocessing.get_all_start_methods()
+            or misses < PARALLEL_MIN_MISSES):
+        return [_extract(path) for path in paths]
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("fork"),
+    ) as executor:
+        return list(executor.map(_extract, paths))
+
+def _prune_ast_cache() -> None:
+    # entries are keyed by content hash, so every edit leaves a stale one
+    # behind; keep only those used by this run
+    try:
+        entries = os.scandir(ast_cache_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".pkl") and entry.name not in _used_cache_files:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+@functools.lru_cache(maxsize=None)
 def _symbol_html(symbol_kind: str) -> str:
     return f"<code class='doc-symbol doc-symbol-toc doc-symbol-{symbol_kind}'></code>"
 
@@ -158,6 +312,29 @@ def _load_api_labels(src_dir: Path) -> dict[str, str]:
     if not init_path.is_file():
         return {}
 
+    # read the API_labels literal without executing the package
+    labels = {}
+    for node in _load_tree(init_path).body:
+        if type(node) is ast.Assign:
+            names = [target.id for target in node.targets if type(target) is ast.Name]
+        elif type(node) is ast.AnnAssign and type(node.target) is ast.Name:
+            names = [node.target.id]
+        else:
+            continue
+        if "API_labels" in names and node.value is not None:
+            try:
+                labels = ast.literal_eval(node.value)
+            except ValueError:
+                labels = _exec_api_labels(init_path)
+
+    if not isinstance(labels, dict):
+        return {}
+
+    return {str(key): str(value) for key, value in labels.items()}
+
+def _exec_api_labels(init_path: Path) -> object:
+    import importlib.util
+
     spec = importlib.util.spec_from_file_location(MODULE_NAME, init_path)
     if spec is None or spec.loader is None:
         return {}
@@ -165,33 +342,30 @@ def _load_api_labels(src_dir: Path) -> dict[str, str]:
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
-    labels = getattr(module, "API_labels", {})
-    if not isinstance(labels, dict):
-        return {}
-
-    return {str(key): str(value) for key, value in labels.items()}
+    return getattr(module, "API_labels", {})
 
-def _ensure_tables_and_figures(target_doc_dir: Path) -> None:
-    if not tables_and_figures_dir.is_dir():
+def _ensure_tables_and_figures(target_doc_dir: str) -> None:
+    if not _CACHED_ASSETS:
         return
 
-    target_dir = target_doc_dir / "tables-and-figures"
-    target_key = target_dir.as_posix()
-    if target_key in _copied_tables_and_figures_targets:
+    target_dir = f"{target_doc_dir}/tables-and-figures"
+    if target_dir in _copied_tables_and_figures_targets:
         return
 
-    for asset_path in tables_and_figures_dir.rglob("*"):
-        if asset_path.is_file():
-            relative_path = asset_path.relative_to(tables_and_figures_dir)
-            destination = target_dir / relative_path
-            with open(asset_path, "rb") as source_file:
-                with mkdocs_gen_files.open(destination.as_posix(), "wb") as target_file:
-                    target_file.write(source_file.read())
+    for asset_path, relative_path in _CACHED_ASSETS:
+        destination = f"{target_dir}/{relative_path}"
+        with open(asset_path, "rb") as source_file:
+            with mkdocs_gen_files.open(destination, "wb") as target_file:
+                shutil.copyfileobj(source_file, target_file, length=1 << 20)
 
-    _copied_tables_and_figures_targets.add(target_key)
+    _copied_tables_and_figures_targets.add(target_dir)
 
-def _write_doc_page(
-    doc_path: Path,
+@functools.lru_cache(maxsize=None)
+def _read_extra_cached(path_str: str, mtime_ns: int) -> str:
+    return Path(path_str).read_text(encoding="utf-8")
+
+def _plan_doc_page(
+    doc_path: str,
     ident: str,
     symbol_kind: str,
     heading_title: str | None,
@@ -199,33 +373,50 @@ def _write_doc_page(
     extra_files: Iterable[Path],
     edit_path: Path,
     directive_options: str | None = None,
-) -> None:
-    with mkdocs_gen_files.open(doc_path, "w") as fd:
-        # fd.write("---\nhide:\n  - toc\n---\n\n")
-        # fd.write("---\nhide:\n  - toc\n---\n\n")
-        if heading_title:
-            symbol = _symbol_html(symbol_kind)
-            # fd.write(f"## {symbol} {heading_title}\n\n")
-            if signature:
-                fd.write(f"## Signature/Parameters\n")
-                # fd.write(f"<code class='doc-symbol doc-symbol-toc doc-symbol-{symbol_kind}'></code> <code class=\"language-python\">\n")
-                # fd.write(f"<pre><code class=\"language-python\">\n")
-                # # fd.write(signature)
-                # fd.write(re.sub(pattern=".*def ", repl='', string=signature))
-                # fd.write("\n</code></pre>\n\n")
-                # fd.write(f"<code class='doc-symbol doc-symbol-toc doc-symbol-{symbol_kind}'></code> <code class=\"language-python\">\n")
-                fd.write(f"``` python\n")
-                fd.write(signature)
-                fd.write("\n```\n\n")
-        fd.write(f"::: {ident}\n")
-        if directive_options:
-            fd.write(directive_options)
-        for extra_file in extra_files:
-            if extra_file.is_file():
-                fd.write("\n\n")
-                fd.write(extra_file.read_text(encoding="utf-8"))
-    mkdocs_gen_files.set_edit_path(doc_path, edit_path)
-    _ensure_tables_and_figures(doc_path.parent)
+) -> WritePlan:
+    parts: List[str] = []
+    # parts.append("---\nhide:\n  - toc\n---\n\n")
+    if heading_title:
+        symbol = _symbol_html(symbol_kind)
+        # parts.append(f"## {symbol} {heading_title}\n\n")
+        if signature:
+            parts.append("## Signature/Parameters\n")
+            # parts.append(f"<code class='doc-symbol doc-symbol-toc doc-symbol-{symbol_kind}'></code> <code class=\"language-python\">\n")
+            # parts.append(f"<pre><code class=\"language-python\">\n")
+            # # parts.append(signature)
+            # parts.append(re.sub(pattern=".*def ", repl='', string=signature))
+            # parts.append("\n</code></pre>\n\n")
+            parts.append("``` python\n")
+            parts.append(signature)
+            parts.append("\n```\n\n")
+    parts.append(f"::: {ident}\n")
+    if directive_options:
+        parts.append(directive_options)
+    for extra_file in extra_files:
+        if extra_file.is_file():
+            parts.append("\n\n")
+            parts.append(_read_extra_cached(str(extra_file), extra_file.stat().st_mtime_ns))
+    return WritePlan(doc_path=doc_path, content="".join(parts), edit_path=edit_path)
+
+def _write_plan(plan: WritePlan) -> None:
+    with mkdocs_gen_files.open(plan.doc_path, "w") as fd:
+        fd.write(plan.content)
+    mkdocs_gen_files.set_edit_path(plan.doc_path, plan.edit_path)
+    _ensure_tables_and_figures(plan.doc_path.rpartition("/")[0])
+
+def _write_buffered(fd: IO[str], lines: Iterable[str], chunk_size: int = 1 << 16) -> None:
+    # one write for small outputs, bounded 64 KiB chunks for large ones
+    buffer: List[str] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size > chunk_size:
+            fd.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        fd.write("".join(buffer))
 
 
 # change these files
@@ -234,20 +425,34 @@ MODULE_NAME = "tidypolars4sci"
 root = Path(__file__).parent.parent.parent
 src = root / MODULE_NAME 
 api_docs_dir = root / "docs" / "api"
+ast_cache_dir = root / ".cache" / "ast"
+_used_cache_files: set[str] = set()
 tables_and_figures_dir = api_docs_dir / "tables-and-figures"
-_copied_tables_and_figures_targets: set[Path] = set()
+# list the assets once; every target directory receives the same files
+_CACHED_ASSETS = tuple(
+    (asset_path, asset_path.relative_to(tables_and_figures_dir).as_posix())
+    for asset_path in tables_and_figures_dir.rglob("*")
+    if asset_path.is_file()
+) if tables_and_figures_dir.is_dir() else ()
+_copied_tables_and_figures_targets: set[str] = set()
 api_labels = _load_api_labels(src)
 
 
 
-for path in sorted(src.rglob("*.py")):
+# sort on path components to keep the same order as sorted(src.rglob("*.py"))
+module_entries = sorted(
+    (entry for entry in _walk_py(src) if entry.name != "__init__.py"),
+    key=lambda entry: entry.path.split(os.sep),
+)
+module_paths = [Path(entry.path) for entry in module_entries]
+extracted_members = _extract_all(module_paths)
+plans: List[WritePlan] = []
+
+for path, (classes, functions) in zip(module_paths, extracted_members):
     module_path = path.relative_to(src).with_suffix("")
     module_ident_parts = tuple(module_path.parts)
     module_file_stem = path.stem
 
-    if module_ident_parts[-1] in {"__init__"}:
-        continue
-
     module_doc_parts = module_ident_parts
     if module_doc_parts[-1] == "__main__":
         module_doc_parts = module_doc_parts[:-1] + ("index",)
@@ -255,26 +460,23 @@ for path in sorted(src.rglob("*.py")):
     module_label = api_labels.get(module_file_stem, module_doc_parts[-1])
     module_nav_parts = module_doc_parts[:-1] + (str(module_label),)
 
-    source = path.read_text(encoding="utf-8")
-    tree = ast.parse(source)
-
-    classes, functions = _get_documented_members(tree)
-
     module_edit_path = path.relative_to(root)
+    module_ident = ".".join(module_ident_parts)
+    module_doc_prefix = _join(module_doc_parts)
 
     for documented_class in classes:
         class_name = documented_class.name
-        class_doc_parts = module_doc_parts + (class_name,)
-        class_ident = ".".join(module_ident_parts + (class_name,))
+        class_doc_prefix = f"{module_doc_prefix}/{class_name}"
+        class_ident = f"{module_ident}.{class_name}"
         class_nav_key = module_nav_parts + (f"{_symbol_html('class')} {class_name}",)
         if documented_class.has_docstring:
-            class_doc_path = Path("reference", *class_doc_parts).with_suffix(".md")
-            nav[class_nav_key] = Path(*class_doc_parts).with_suffix(".md").as_posix()
+            class_doc_path = f"reference/{class_doc_prefix}.md"
+            nav[class_nav_key] = f"{class_doc_prefix}.md"
             class_extra_files = [api_docs_dir / f"{module_file_stem}-{class_name}.md"]
             class_signature = documented_class.signature
             if documented_class.init_signature:
                 class_signature = f"{class_signature}\n{documented_class.init_signature}"
-            _write_doc_page(
+            plans.append(_plan_doc_page(
                 class_doc_path,
                 class_ident,
                 "class",
@@ -283,19 +485,19 @@ for path in sorted(src.rglob("*.py")):
                 class_extra_files,
                 module_edit_path,
                 directive_options="    options:\n      members: []\n",
-            )
+            ))
 
         for method in documented_class.methods:
             method_name = method.name
-            method_doc_parts = class_doc_parts + (method_name,)
-            method_ident = ".".join(module_ident_parts + (class_name, method_name))
-            method_doc_path = Path("reference", *method_doc_parts).with_suffix(".md")
+            method_doc_prefix = f"{class_doc_prefix}/{method_name}"
+            method_ident = f"{class_ident}.{method_name}"
+            method_doc_path = f"reference/{method_doc_prefix}.md"
             method_nav_key = class_nav_key + (f"{_symbol_html('method')} {method_name}",)
-            nav[method_nav_key] = Path(*method_doc_parts).with_suffix(".md").as_posix()
+            nav[method_nav_key] = f"{method_doc_prefix}.md"
             method_extra_files = [
                 api_docs_dir / f"{module_file_stem}-{class_name}-{method_name}.md"
             ]
-            _write_doc_page(
+            plans.append(_plan_doc_page(
                 method_doc_path,
                 method_ident,
                 "method",
@@ -303,17 +505,17 @@ for path in sorted(src.rglob("*.py")):
                 method.signature,
                 method_extra_files,
                 module_edit_path,
-            )
+            ))
 
     for function in functions:
         function_name = function.name
-        function_doc_parts = module_doc_parts + (function_name,)
-        function_ident = ".".join(module_ident_parts + (function_name,))
-        function_doc_path = Path("reference", *function_doc_parts).with_suffix(".md")
+        function_doc_prefix = f"{module_doc_prefix}/{function_name}"
+        function_ident = f"{module_ident}.{function_name}"
+        function_doc_path = f"reference/{function_doc_prefix}.md"
         function_nav_key = module_nav_parts + (f"{_symbol_html('function')} {function_name}",)
-        nav[function_nav_key] = Path(*function_doc_parts).with_suffix(".md").as_posix()
+        nav[function_nav_key] = f"{function_doc_prefix}.md"
         function_extra_files = [api_docs_dir / f"{module_file_stem}-{function_name}.md"]
-        _write_doc_page(
+        plans.append(_plan_doc_page(
             function_doc_path,
             function_ident,
             "function",
@@ -321,7 +523,12 @@ for path in sorted(src.rglob("*.py")):
             function.signature,
             function_extra_files,
             module_edit_path,
-        )
+        ))
+
+for plan in plans:
+    _write_plan(plan)
 
 with mkdocs_gen_files.open("reference/SUMMARY.md", "w") as nav_file:
-    nav_file.writelines(nav.build_literate_nav())
+    _write_buffered(nav_file, nav.build_literate_nav())
+
+_prune_ast_cache()
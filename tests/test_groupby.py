@@ -66,3 +66,17 @@ def test_group_summarize_across():
                           'max_y': [4, 5],
                           'avg_x': [0.5, 2]})
     assert actual.equals(expected), "group summarize across failed"
+
+def test_group_mutate_chained():
+    """Grouped mutate sees columns created earlier in the same call"""
+    df = tp.tibble({'x': range(4), 'y': ['a', 'a', 'b', 'b']})
+    actual = (
+        df.mutate(avg_x = col('x').mean(),
+                  dev = col('x') - col('avg_x'),
+                  by = 'y')
+        .arrange('x')
+    )
+    expected = tp.tibble({'x': range(4), 'y': ['a', 'a', 'b', 'b'],
+                          'avg_x': [.5, .5, 2.5, 2.5],
+                          'dev': [-.5, .5, -.5, .5]})
+    assert actual.equals(expected), "chained group mutate failed"
@@ -0,0 +1,66 @@
+import pytest
+import tidypolars as tp
+
+def _write_xlsx(path, rows):
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+def test_read_xls_headers_usecols(tmp_path):
+    """Can read hierarchical headers with pandas' usecols and nrows"""
+    fn = str(tmp_path / "x.xlsx")
+    _write_xlsx(fn, [['G1', 'G1', 'G2'], ['a', 'b', 'c'],
+                     [1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    actual = tp.read_data(fn = fn, n_headers = 2, usecols = 'A:B', nrows = 2,
+                          silently = True)
+    expected = tp.tibble({'G1 (a)': [1, 4], 'G1 (b)': [2, 5]})
+    assert actual.equals(expected), "read_xls with usecols failed"
+
+def test_read_xls_headers_usecols_and_cols(tmp_path):
+    """Passing both cols and usecols is an error"""
+    fn = str(tmp_path / "x.xlsx")
+    _write_xlsx(fn, [['G1', 'G1'], ['a', 'b'], [1, 2]])
+    with pytest.raises(ValueError):
+        tp.read_data(fn = fn, n_headers = 2, usecols = 'A:B', cols = [0],
+                     silently = True)
+
+def test_read_xls_keeps_blank_rows(tmp_path):
+    """Blank rows are kept, as with pandas"""
+    fn = str(tmp_path / "x.xlsx")
+    _write_xlsx(fn, [['a', 'b'], [1, 2], [None, None], [3, 4]])
+    actual = tp.read_data(fn = fn, silently = True)
+    assert actual.nrow == 3, "read_xls dropped a blank row"
+    actual = tp.read_data(fn = fn, n_headers = 1, silently = True)
+    assert actual.nrow == 3, "read_xls with headers dropped a blank row"
+
+def test_read_csv_headers_comment(tmp_path):
+    """Hierarchical CSV headers honour comment_prefix and quoted newlines"""
+    fn = tmp_path / "x.csv"
+    fn.write_text("# a comment\nG1;G1\na;b\n1;2\n")
+    actual = tp.read_data(fn = str(fn), n_headers = 2, comment_prefix = '#',
+                          silently = True)
+    assert actual.names == ['G1 (a)', 'G1 (b)'], "read_csv with comment failed"
+    assert actual.nrow == 1, "read_csv with comment read header rows as data"
+    fn.write_text('"G\n1";"G\n1"\na;b\n1;2\n')
+    actual = tp.read_data(fn = str(fn), n_headers = 2, silently = True)
+    assert actual.names == ['G\n1 (a)', 'G\n1 (b)'], "read_csv with quoted newline failed"
+    assert actual.nrow == 1, "read_csv with quoted newline read header rows as data"
+
+def test_read_xls_blank_header_names(tmp_path):
+    """Blank header cells are named as pandas names them"""
+    fn = str(tmp_path / "x.xlsx")
+    _write_xlsx(fn, [['a', None, 'c'], [1, 2, 3]])
+    actual = tp.read_data(fn = fn, silently = True)
+    assert actual.names == ['a', 'Unnamed: 1', 'c'], "blank header names differ from pandas"
+
+def test_read_csv_big_data_headers_cols(tmp_path):
+    """big_data with hierarchical headers returns only the selected columns"""
+    fn = tmp_path / "x.csv"
+    fn.write_text("G1;G1;G2\na;b;c\n1;2;3\n4;5;6\n")
+    actual = tp.read_data(fn = str(fn), n_headers = 2, big_data = True,
+                          cols = ['G2', 'G1 (a)'], silently = True)
+    expected = tp.tibble({'G2': [3, 6], 'G1 (a)': [1, 4]})
+    assert actual.equals(expected), "big_data cols with headers failed"
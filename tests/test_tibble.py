@@ -463,3 +463,69 @@ def test_funs_in_a_row():
     df.tail()
     df.arrange('x', 'y')
     assert True, "Functions in a row failed"
+
+def test_filter_series():
+    """Can filter with a boolean Series"""
+    df = tp.tibble({'x': range(3)})
+    actual = df.filter(pl.Series([True, False, True]))
+    expected = tp.tibble({'x': [0, 2]})
+    assert actual.equals(expected), "filter with Series failed"
+
+def test_arrange_series():
+    """Can arrange by a Series"""
+    df = tp.tibble({'x': ['a', 'b', 'c']})
+    actual = df.arrange(pl.Series([3, 1, 2]))
+    expected = tp.tibble({'x': ['b', 'c', 'a']})
+    assert actual.equals(expected), "arrange with Series failed"
+
+def test_mutate_series():
+    """Can mutate with a named Series"""
+    df = tp.tibble({'x': range(3)})
+    actual = df.mutate(pl.Series('z', [7, 8, 9]))
+    expected = tp.tibble({'x': range(3), 'z': [7, 8, 9]})
+    assert actual.equals(expected), "mutate with Series failed"
+
+def test_slice_series():
+    """Can slice with a Series of row positions"""
+    df = tp.tibble({'x': range(3), 'y': ['a', 'a', 'b']})
+    actual = df.slice(pl.Series([0, 2]))
+    expected = tp.tibble({'x': [0, 2], 'y': ['a', 'b']})
+    assert actual.equals(expected), "slice with Series failed"
+
+def test_mutate_chained():
+    """Later expressions see columns created earlier in the same mutate"""
+    df = tp.tibble({'x': [1, 2]})
+    actual = df.mutate(y = col('x') * 2, z = col('y') + 1, x = col('z') * col('y'))
+    expected = tp.tibble({'x': [6, 20], 'y': [2, 4], 'z': [3, 5]})
+    assert actual.equals(expected), "chained mutate failed"
+
+def test_mutate_swap():
+    """Reassigning a column is visible to the next expression"""
+    df = tp.tibble({'x': [1, 2], 'y': [3, 4]})
+    actual = df.mutate(x = col('y'), y = col('x'))
+    expected = tp.tibble({'x': [3, 4], 'y': [3, 4]})
+    assert actual.equals(expected), "swap mutate failed"
+
+def test_mutate_wildcard_inputs():
+    """Expressions reading columns by wildcard, exclude, regex, dtype or index see earlier results"""
+    import polars.selectors as cs
+    df = tp.tibble({'a': [1, 2], 'b': [3, 4]})
+    actual = df.mutate(c = col('a') * 2, s = pl.struct(pl.all()))
+    assert actual.pull('s').struct.field('c').to_list() == [2, 4], "mutate with pl.all() failed"
+    actual = df.mutate(z = col('a') + 1, tot = pl.sum_horizontal(pl.exclude('a')))
+    assert actual.pull('tot').to_list() == [5, 7], "mutate with exclude failed"
+    actual = df.mutate(x1 = col('a'), tot = pl.sum_horizontal(col('^x.*$')))
+    assert actual.pull('tot').to_list() == [1, 2], "mutate with regex failed"
+    actual = df.mutate(f = col('a') * 1.5, tot = pl.sum_horizontal(col(pl.Float64)))
+    assert actual.pull('tot').to_list() == [1.5, 3.0], "mutate with dtype failed"
+    actual = df.mutate(f = col('a') * 1.5, tot = pl.sum_horizontal(cs.float()))
+    assert actual.pull('tot').to_list() == [1.5, 3.0], "mutate with selector failed"
+    actual = df.mutate(c = col('a') * 3, n = pl.nth(2))
+    assert actual.pull('n').to_list() == [3, 6], "mutate with nth failed"
+
+def test_mutate_constant_signed_zero():
+    """Constants that compare equal keep their own value"""
+    df = tp.tibble({'x': [1]})
+    df.mutate(w = 0.0)
+    actual = df.mutate(w = -0.0).mutate(inv = 1 / col('w'))
+    assert actual.pull('inv').to_list() == [float('-inf')], "mutate constant -0.0 failed"
@@ -13,7 +13,25 @@ __all__ = (
 
 DATA_DIR = Path(__file__).parent
 
-mtcars = __load_mtcars__()
-diamonds = __load_diamonds__()
-starwars = __load_starwars__()
-vote = __load_vote__()
+# the submodules share their names with the datasets; unbind them so
+# attribute access falls through to __getattr__
+del diamonds, mtcars, starwars, vote
+
+# datasets are loaded on first access (PEP 562) and cached
+_cache = {}
+_loaders = {
+    "diamonds": __load_diamonds__,
+    "mtcars": __load_mtcars__,
+    "starwars": __load_starwars__,
+    "vote": __load_vote__,
+}
+
+def __getattr__(name):
+    if name in _loaders:
+        if name not in _cache:
+            _cache[name] = _loaders[name]()
+        return _cache[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_loaders))
@@ -2,17 +2,21 @@ from pathlib import Path
 from ..io import read_data
 from ..type_conversion import as_factor
 from ..tibble_df import tibble
+from .parquet_cache import _load_with_parquet_cache
 
 DATA_DIR = Path(__file__).parent
 
 def __load_diamonds__():
+    df = _load_with_parquet_cache(DATA_DIR / "diamonds.csv", __read_diamonds__)
+    return tibble(df)
+
+def __read_diamonds__():
     df = read_data(fn=DATA_DIR / "diamonds.csv", sep=',', silently=True)
     df = df.mutate(cut = as_factor('cut',
                                      levels="Fair, Good, Very Good, Premium, Ideal".split(", ")),
-                   #  "I1 SI2 SI1 VS2 VS1 VVS2 VVS1 IF".split(),
-                   clarity = as_factor('clarity'),
-                   # list("DEFGHIJ")
-                   color   = as_factor('color'),
+                   clarity = as_factor('clarity',
+                                       levels="I1,SI2,SI1,VS2,VS1,VVS2,VVS1,IF".split(",")),
+                   color   = as_factor('color', levels=list("DEFGHIJ")),
                    )
     return tibble(df)
 
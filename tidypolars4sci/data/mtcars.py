@@ -1,11 +1,12 @@
 from pathlib import Path
 from ..io import read_data
 from ..tibble_df import tibble
+from .parquet_cache import _load_with_parquet_cache
 
 DATA_DIR = Path(__file__).parent
 
 def __load_mtcars__():
-    mtcars = read_data(fn=DATA_DIR / "mtcars.csv", sep=',', silently=True)
+    mtcars = _load_with_parquet_cache(DATA_DIR / "mtcars.csv", __read_mtcars__)
     mtcars.__doc__ = """
     Motor Trend Car Road Tests
 
@@ -42,3 +43,5 @@ def __load_mtcars__():
     """
     return tibble(mtcars)
 
+def __read_mtcars__():
+    return read_data(fn=DATA_DIR / "mtcars.csv", sep=',', silently=True)
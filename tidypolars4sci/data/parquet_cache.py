@@ -0,0 +1,32 @@
+import os
+import polars as pl
+from pathlib import Path
+from ..tibble_df import from_polars
+
+def _load_with_parquet_cache(source: Path, reader):
+    # """
+    # Load a bundled dataset through a Parquet sidecar stored next to
+    # the source file (e.g., diamonds.csv -> diamonds.parquet).
+
+    # The sidecar is used when it is at least as recent as both the source
+    # file and the module that defines `reader`. Otherwise, `reader()` loads the data from the source and
+    # the result is written to the sidecar for the next import. If the
+    # package directory is read-only, the sidecar is simply skipped.
+    # """
+    sidecar = source.with_suffix(".parquet")
+    try:
+        newest_input = max(os.stat(source).st_mtime,
+                           os.stat(reader.__code__.co_filename).st_mtime)
+        if sidecar.stat().st_mtime >= newest_input:
+            return from_polars(pl.read_parquet(sidecar))
+    except (OSError, pl.exceptions.PolarsError):
+        pass
+
+    df = reader()
+    tmp = sidecar.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_polars().write_parquet(tmp)
+        os.replace(tmp, sidecar)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    return df
@@ -1,11 +1,12 @@
 from pathlib import Path
 from ..io import read_data
 from ..tibble_df import tibble
+from .parquet_cache import _load_with_parquet_cache
 
 DATA_DIR = Path(__file__).parent
 
 def __load_starwars__():
-    starwars, _ = read_data(fn=DATA_DIR / "starwars.rda", sep=',', silently=True)
+    starwars = _load_with_parquet_cache(DATA_DIR / "starwars.rda", __read_starwars__)
     starwars.__doc__ = """
     Starwars characters dataset.
 
@@ -47,4 +48,8 @@ def __load_starwars__():
     """
     return tibble(starwars)
 
+def __read_starwars__():
+    starwars, _ = read_data(fn=DATA_DIR / "starwars.rda", sep=',', silently=True)
+    return starwars
+
 # starwars = __load_starwars__()
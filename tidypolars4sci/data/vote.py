@@ -1,11 +1,12 @@
 from pathlib import Path
 from ..io import read_data
 from ..tibble_df import tibble
+from .parquet_cache import _load_with_parquet_cache
 
 DATA_DIR = Path(__file__).parent
 
 def __load_vote__():
-    vote = read_data(fn=DATA_DIR / "vote.csv", sep=',', silently=True)
+    vote = _load_with_parquet_cache(DATA_DIR / "vote.csv", __read_vote__)
     vote.__doc__ = """
     Synthetic vote experiment data.
 
@@ -35,6 +36,9 @@ def __load_vote__():
     vote.__codebook__ = codebook()
     return tibble(vote)
 
+def __read_vote__():
+    return read_data(fn=DATA_DIR / "vote.csv", sep=',', silently=True)
+
 def codebook():
     data = {
         "Variable": ["age", "income", "gender", "ideology",
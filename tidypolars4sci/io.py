@@ -1,24 +1,80 @@
 from .tibble_df import from_pandas, from_polars
-from .utils import _filter_kwargs_for, _expand_to_full_path_or_url
+from .utils import _filter_kwargs_for, _allowed_params, _expand_to_full_path_or_url
 # 
 import polars as pl
 import copy
-import re, os
+import os
+from io import BytesIO
+from itertools import islice
 import pandas as pd
-import pyreadstat
+import numpy as np
 # from pyreadr import read_r
 from dataclasses import dataclass
+from functools import partial
+from importlib.util import find_spec
+from types import MappingProxyType
 from typing import Callable, List
 from typing import Callable, List, Any
 from typing import Dict, Optional, Tuple
-# google spreadsheet
-import gspread
-from google.oauth2.service_account import Credentials
 
 __all__ = [
     "read_data",
    ]
 
+# extensions are matched case-insensitively (see _EXT_TO_KIND)
+_ACCEPTED_FILES = MappingProxyType({
+    'csv-like'                : ('.csv', '.tsv', '.dat', '.txt'),
+    'excel-like'              : ('.xls', '.xlsx', '.xlt', '.xltx', '.ods'),
+    'R files'                 : ('.rdata', '.rda', '.rds'),
+    'Stata files'             : ('.dta',),
+    'SPSS files'              : ('.sav',),
+    'URL'                     : ('URL with any of the supported file types',),
+    'Google Drive Spreadsheet': ('See documentation',),
+})
+_EXT_TO_KIND = {ext: kind
+                for kind, exts in _ACCEPTED_FILES.items()
+                for ext in exts if ext.startswith('.')}
+
+# python-calamine parses .xlsx in a single streaming pass (no openpyxl DOM);
+# read_xls uses it when it is installed and no engine is given
+_HAS_CALAMINE = find_spec("python_calamine") is not None
+_CALAMINE_EXTS = ('.xlsx', '.xlsm')
+# fastexcel backs polars.read_excel(engine='calamine')
+_HAS_FASTEXCEL = find_spec("fastexcel") is not None
+# read_csv options under which a row is not simply one line of the file
+_CSV_ROW_OPTIONS = ('comment_prefix', 'skip_rows', 'skip_lines', 'quote_char',
+                    'eol_char')
+
+def _import_pyreadstat():
+    # pyreadstat is only needed for .dta/.sav, so it is imported on first use
+    try:
+        import pyreadstat
+    except ImportError as exc:
+        raise ImportError(
+            "Reading .dta/.sav files requires 'pyreadstat'. Install it with:\n\n"
+            "    pip install pyreadstat\n"
+        ) from exc
+    return pyreadstat
+
+def _pd_to_pl(df_pd: pd.DataFrame) -> pl.DataFrame:
+    # pandas -> arrow -> polars, which reuses the numeric buffers instead
+    # of copying them column by column; columns arrow cannot convert
+    # (e.g. mixed object dtypes) fall back to pl.from_pandas
+    import pyarrow as pa
+    try:
+        tbl = pa.Table.from_pandas(df_pd, preserve_index=False, safe=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return pl.from_pandas(df_pd)
+    return pl.from_arrow(tbl, rechunk=False)
+
+def _read_stat_file(reader, fn, **kws_reader):
+    # pyreadstat returns the data and the labels from a single pass
+    df, meta = reader(fn, **kws_reader)
+    labels = DATA_LABELS(original=list(meta.column_names),
+                         variables=meta.column_names_to_labels,
+                         values=meta.variable_value_labels)
+    return df, labels
+
 @dataclass
 class DATA_LABELS:
     original: List[str]
@@ -26,27 +82,16 @@ class DATA_LABELS:
     values: Dict[str, Optional[Dict[Any, str]]]
 
     def __post_init__(self):
-        # Keep only variables with a real non-empty string label
-        self.variables = {
-            k: v
-            for k, v in self.variables.items()
-            if isinstance(v, str) and v.strip()
-        }
-
-        # complete the variable labels dictionary:
+        # Keep only variables with a real non-empty string label, and
+        # complete the dictionary in the same pass:
         #   for variables with no labels, use varname:varname
-        variables_final = {}
-        for var in self.original:
-            label = var if var not in self.variables else self.variables[var]
-            variables_final[var] = label
-        self.variables = variables_final
+        labelled = {k: v for k, v in self.variables.items()
+                    if isinstance(v, str) and v.strip()}
+        self.variables = {var: labelled.get(var, var) for var in self.original}
 
         # Keep only variables with a non-empty value-label dict
-        self.values = {
-            k: d
-            for k, d in self.values.items()
-            if isinstance(d, dict) and len(d) > 0
-        }
+        self.values = {k: d for k, d in self.values.items()
+                       if isinstance(d, dict) and d}
 
     def as_dict(self) -> Dict[str, Any]:
         return {
@@ -82,19 +127,32 @@ class read_data():
     sheet_name : str
         Name of the sheet to load.
 
-    cols : list of str
+    cols : list of str | list of int
         List with names of the columns to return.
-        Used with .sav files.
+        Used with .sav files, spreadsheets, and csv-like files
+        with big_data=True. For spreadsheets, 0-based column
+        positions are also accepted. Only the selected columns
+        are parsed.
+
+    n_rows : int
+        Used with spreadsheets. Maximum number of data rows to read.
 
     sep : str (Default ";")
         Specify the column separator for .csv files
 
     big_data : bool
-        If True, uses dask to load the data. Default: False
+        If True, csv-like files are scanned lazily and collected
+        with the polars streaming engine, which keeps memory bounded.
+        Other formats are read as usual. Default: False
 
     silently : bool (optional)
         If True, do now show a completion message
 
+    coerce_strings_to_factor : bool
+        Used with R files. If True, character columns are converted
+        to R factors before being passed to Python, so they arrive
+        as categoricals. Default: False
+
     sheet_name : str | int
         Sheet name or index.
 
@@ -134,19 +192,24 @@ class read_data():
 
     * .txt => polars.read_csv (lines into list)
 
-    * .xls  => pandas.read_excel
-    * .xlsx => pandas.read_excel
-    * .xlt  => pandas.read_excel
-    * .xltx => pandas.read_excel
-    * .ods  => pandas.read_excel
+    * .xls  => polars.read_excel (engine='calamine')
+    * .xlsx => polars.read_excel (engine='calamine')
+    * .xlt  => polars.read_excel (engine='calamine')
+    * .xltx => polars.read_excel (engine='calamine')
+    * .ods  => polars.read_excel (engine='calamine')
 
-    * .dta   => pandas.read_stata
+    Spreadsheets fall back to pandas.read_excel when fastexcel is
+    not installed, with engine='pandas' or another pandas engine,
+    or when pandas-only keyword arguments are given.
+
+    * .dta   => pyreadstat.read_dta
     * .sav   => pyreadstat.read_sav
     * .rds   => pyreadr.read_r
     * .rda   => pyreadr.read_r
     * .Rdata => pyreadr.read_r
 
-    Big data is handled with Dask
+    Big data (csv-like files) => polars.scan_csv, collected with
+    the streaming engine
 
     Hierarchical header:
 
@@ -200,52 +263,49 @@ class read_data():
          
         fn = _expand_to_full_path_or_url(kws.get('fn', None))
         url = kws.get('url', None)
-        big_data = kws.get("big_data", False)
         silently = kws.get("silently", False)
 
         assert fn or url, "Either fn or url must be provided."
 
-        if not bool(re.search(pattern="^http", string=fn)):
+        is_url = isinstance(fn, str) and fn.startswith(("http://", "https://"))
+        if fn and not is_url:
             assert os.path.isfile(fn), f"File {fn} not found."
 
-        fn_base = os.path.basename(fn)
+        fn_base = os.path.basename(fn) if fn else None
         fn_type = os.path.splitext(fn)[1] if fn else None
-         
-        ACCEPTED_FILES = self.get_accepted_file_formats()
+        kind = _EXT_TO_KIND.get(fn_type.lower()) if fn_type else None
 
         print(f"Loading data '{url or fn_base}'...", end=" ") if not silently else None
-        if not big_data:
-            
-            if fn_type in ACCEPTED_FILES['csv-like']:
-                df =self.read_csv(**kws)
+        if kind == 'csv-like':
+            df =self.read_csv(**kws)
 
-            elif fn_type in ACCEPTED_FILES['excel-like']:
-                df =self.read_xls(**kws)
+        elif kind == 'excel-like':
+            df =self.read_xls(**kws)
 
-            elif fn_type in ACCEPTED_FILES['Stata files']:
-                df =self.read_dta(**kws)
+        elif kind == 'Stata files':
+            df =self.read_dta(**kws)
 
-            elif fn_type in ACCEPTED_FILES['SPSS files']:
-                df = self.read_sav(**kws)
+        elif kind == 'SPSS files':
+            df = self.read_sav(**kws)
 
-            elif fn_type in ACCEPTED_FILES['R files']:
-                df = self.read_Rdata(**kws)
+        elif kind == 'R files':
+            df = self.read_Rdata(**kws)
 
-            elif kws.get('url', None) and kws.get('credentials', None):
-                df =self.read_gspread(**kws)
+        elif kws.get('url', None) and kws.get('credentials', None):
+            df =self.read_gspread(**kws)
 
-            else:
-                print(f"No reader for file type {fn_type}. If you are trying to read "+
-                      "a Google spreadsheet, check the 'read_data' documentation.")
-                df = None
         else:
-            read_dask(fn, **kws)
+            print(f"No reader for file type {fn_type}. If you are trying to read "+
+                  "a Google spreadsheet, check the 'read_data' documentation.")
+            df = None
 
         print("done!") if not silently else None
         return df
 
     def read_csv(**kws):
-        reader = pl.read_csv
+        # big_data: lazy scan collected with the streaming engine
+        big_data = kws.get("big_data", False)
+        reader = pl.scan_csv if big_data else pl.read_csv
         kws_reader = _filter_kwargs_for(reader, kws)
         _, ext = os.path.splitext(kws.get("fn", None))
 
@@ -261,34 +321,161 @@ class read_data():
         fn = kws.get("fn", None)
         n = kws.get("n_headers", 0)
         if n>0:
-            df  = reader(fn, skip_lines=n, has_header=False, **kws_reader)
-            dfh = reader(fn, n_rows=n, has_header=False, **kws_reader)
-            df = read_data._apply_multiheader_from_frames(df, dfh, **kws)
+            header, by_rows = read_data._csv_header_lines(fn, n, kws_reader)
+            if by_rows:
+                # skip_rows follows comments and quoting; skip_lines does not
+                kws_data = dict(kws_reader, skip_rows=kws_reader.get('skip_rows', 0) + n)
+            else:
+                kws_data = dict(kws_reader, skip_lines=n)
+            df  = reader(fn, has_header=False, **kws_data)
+            dfh = read_data._read_csv_header(fn, n, header, pl.read_csv,
+                                             _filter_kwargs_for(pl.read_csv, kws_reader))
+            cols = kws.get("cols", None)
+            if big_data and cols is not None:
+                # select on the scan, so only these columns are parsed
+                names = read_data._multiheader_names(dfh, **kws)
+                positions = read_data._xls_positions(cols, names)
+                raw = df.collect_schema().names()
+                df = df.select([raw[i] for i in positions]).collect(engine='streaming')
+                df = read_data._with_names(df, [names[i] for i in positions])
+            else:
+                if big_data:
+                    df = df.collect(engine='streaming')
+                df = read_data._apply_multiheader_from_frames(df, dfh, **kws)
         else:
-            df = from_polars(reader(fn, **kws_reader))
+            df = reader(fn, **kws_reader)
+            if big_data:
+                cols = kws.get("cols", None)
+                df = (df if cols is None else df.select(cols)).collect(engine='streaming')
+            df = from_polars(df)
         return df
+
+    def _csv_header_lines(fn, n, kws_reader):
+        # The first n lines of a local file, and whether the n header rows
+        # must be counted as rows rather than lines (comments, skipped
+        # rows, quoted cells that can hold newlines). Lines are only
+        # returned when they are the header rows.
+        by_rows = any(k in kws_reader for k in _CSV_ROW_OPTIONS)
+        if by_rows or not os.path.isfile(fn):
+            return None, by_rows
+        with open(fn, "rb") as f:
+            header = b"".join(islice(f, n))
+        if b'"' in header:
+            return None, True
+        return header, False
+
+    def _read_csv_header(fn, n, header, reader, kws_reader):
+        # Parse the header frame. When the header lines were taken straight
+        # from the file they are parsed from memory, so polars tokenizes
+        # the file only once (for the data); otherwise the first n rows
+        # are read.
+        if header is None:
+            return reader(fn, n_rows=n, has_header=False, **kws_reader)
+        return reader(BytesIO(header), has_header=False, **kws_reader)
     
     def read_xls(**kws):
         reader = pd.read_excel
         kws_reader = _filter_kwargs_for(reader, kws)
+        engine = kws_reader.get('engine', None)
+
+        # polars reads the sheet with calamine straight into a polars frame;
+        # pandas is kept for engine='pandas', other pandas engines, and
+        # pandas-only keyword arguments
+        # sheet_name=None or a list (several sheets) also stays on pandas
+        if (engine in (None, 'calamine') and _HAS_FASTEXCEL and
+            kws_reader.keys() <= {'sheet_name', 'engine'} and
+            isinstance(kws_reader.get('sheet_name', 0), (int, str))):
+            return read_data._read_xls_polars(**kws)
+        if engine == 'pandas':
+            del kws_reader['engine']
 
         fn = kws.get("fn", None)
+        if (_HAS_CALAMINE and 'engine' not in kws_reader and
+            os.path.splitext(fn)[1].lower() in _CALAMINE_EXTS):
+            kws_reader['engine'] = 'calamine'
+
+        cols = kws.get("cols", None)
+        n_rows = kws.get("n_rows", None)
         n = kws.get("n_headers", 0)
         if n>0:
-            df  = pl.from_pandas(reader(fn, skiprows=n, header=None, **kws_reader))
-            dfh = pl.from_pandas(reader(fn, nrows=n, header=None, **kws_reader))
-            df = read_data._apply_multiheader_from_frames(df, dfh, **kws)
+            # open the workbook once and parse header and data from it;
+            # the header is parsed in full (merged cells fill forward
+            # across columns) and only the selected data columns are read
+            kws_parse = {k: v for k, v in kws_reader.items()
+                         if k not in ('engine', 'storage_options', 'engine_kwargs')}
+            # pandas' own usecols/nrows are merged with cols/n_rows
+            usecols = kws_parse.pop('usecols', None)
+            nrows = kws_parse.pop('nrows', None)
+            if usecols is not None and cols is not None:
+                raise ValueError("Use either 'cols' or 'usecols', not both.")
+            if nrows is not None:
+                if n_rows is not None:
+                    raise ValueError("Use either 'n_rows' or 'nrows', not both.")
+                n_rows = nrows
+            with pd.ExcelFile(fn, engine=kws_reader.get('engine', None)) as xf:
+                # usecols selects the header and the data columns alike
+                dfh = pl.from_pandas(xf.parse(nrows=n, header=None, usecols=usecols,
+                                              **kws_parse))
+                names = read_data._multiheader_names(dfh, **kws)
+                positions = read_data._xls_positions(cols, names)
+                df  = pl.from_pandas(xf.parse(skiprows=n, header=None,
+                                              usecols=usecols if positions is None
+                                              else sorted(positions),
+                                              nrows=n_rows, **kws_parse))
+            df = read_data._with_names(*read_data._xls_reorder(df, names, positions))
         else:
+            if cols is not None:
+                kws_reader['usecols'] = cols
+            if n_rows is not None:
+                kws_reader['nrows'] = n_rows
             df = from_polars(from_pandas(reader(fn, **kws_reader)))
 
         return df
 
+    def _read_xls_polars(**kws):
+        fn = kws.get("fn", None)
+        sheet = kws.get("sheet_name", 0)
+        cols = kws.get("cols", None)
+        n_rows = kws.get("n_rows", None)
+        n = kws.get("n_headers", 0)
+
+        # pandas-style 0-based sheet index -> polars 1-based sheet_id
+        sheet = {'sheet_id': sheet + 1} if isinstance(sheet, int) else {'sheet_name': sheet}
+        # keep blank rows and columns, as pandas does
+        keep = {'drop_empty_rows': False, 'drop_empty_cols': False}
+        if n>0:
+            # the header is read in full (merged cells fill forward across
+            # columns); only the selected data columns are read
+            dfh = pl.read_excel(fn, engine='calamine', **sheet, **keep,
+                                read_options={'header_row': None, 'n_rows': n,
+                                              'dtypes': 'string'})
+            names = read_data._multiheader_names(dfh, **kws)
+            positions = read_data._xls_positions(cols, names)
+            df  = pl.read_excel(fn, engine='calamine', **sheet, **keep,
+                                columns=positions and sorted(positions),
+                                read_options={'header_row': None, 'skip_rows': n,
+                                              'n_rows': n_rows})
+            df = read_data._with_names(*read_data._xls_reorder(df, names, positions))
+        else:
+            df = pl.read_excel(fn, engine='calamine', **sheet, **keep, columns=cols,
+                               read_options={'n_rows': n_rows})
+            df = from_polars(read_data._xls_unnamed(df))
+        return df
+
+    def _xls_unnamed(df):
+        # blank header cells: fastexcel names them '__UNNAMED__<i>', pandas
+        # 'Unnamed: <i>' (same 0-based sheet position); use the pandas form
+        # so the names don't depend on which engine read the sheet
+        prefix = '__UNNAMED__'
+        return df.rename({c: f"Unnamed: {c[len(prefix):]}" for c in df.columns
+                          if c.startswith(prefix) and c[len(prefix):].isdigit()})
+
     def read_Rdata(**kws):
         from .io_r import load_r
 
         fn = kws.get("fn", None)
-        df, labels = load_r(fn)
-        return from_pandas(df), labels
+        df, labels = load_r(fn, coerce_strings_to_factor=kws.get("coerce_strings_to_factor", False))
+        return from_polars(_pd_to_pl(df)), labels
 
     def read_dta(**kws):
         reader = pd.read_stata
@@ -296,16 +483,18 @@ class read_data():
 
         fn=kws.get('fn')
         df = reader(fn, convert_categoricals=False, **kws_reader)
-        df = from_pandas(df)
-
-        labels    = reader(fn, iterator=True)
-        variables = labels.variable_labels()
-        values    = labels.value_labels()
-        labels    = DATA_LABELS(original=df.names, variables=variables, values=values)
+        df = from_polars(_pd_to_pl(df))
+
+        # labels from a metadata-only pass, which reads just the file
+        # header and label tables; value labels are keyed by variable
+        _, meta = _import_pyreadstat().read_dta(fn, metadataonly=True)
+        labels = DATA_LABELS(original=df.names,
+                             variables=meta.column_names_to_labels,
+                             values=meta.variable_value_labels)
         return df, labels
 
     def read_sav(**kws):
-        reader = pyreadstat.read_sav
+        reader = _import_pyreadstat().read_sav
         kws_reader = _filter_kwargs_for(reader, kws)
 
         fn=kws.get('fn')
@@ -322,21 +511,38 @@ class read_data():
             row_first = 0
             row_last = 0
 
-        df, meta = reader(fn,
-                          usecols=cols,
-                          row_offset=row_first,
-                          row_limit=row_last,
-                          **kws_reader)
-        df = from_pandas(df)
-
-        # collect labels
-        variables = meta.column_names_to_labels
-        values    = meta.variable_value_labels
-        labels    = DATA_LABELS(original=df.names, variables=variables, values=values)
+        # ask for plain column lists (pyreadstat >= 1.2) to skip the
+        # pandas intermediate; older versions keep the pandas output
+        as_dict = ('output_format' in _allowed_params(reader) and
+                   'output_format' not in kws_reader)
+        if as_dict:
+            kws_reader['output_format'] = 'dict'
+
+        df, labels = _read_stat_file(reader, fn,
+                                     usecols=cols,
+                                     row_offset=row_first,
+                                     row_limit=row_last,
+                                     **kws_reader)
+        if as_dict:
+            # all-missing numeric columns come back as Null (pandas: Float64)
+            df = from_polars(pl.from_dict(df).with_columns(pl.col(pl.Null).cast(pl.Float64)))
+        else:
+            df = from_polars(_pd_to_pl(df))
         
         return df, labels
 
     def read_gspread(**kws):
+        # google spreadsheet
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+        except ImportError as exc:
+            raise ImportError(
+                "Reading Google spreadsheets requires 'gspread' and 'google-auth'. "
+                "Install them with:\n\n"
+                "    pip install gspread google-auth\n"
+            ) from exc
+
         assert kws.get("credentials", None),"A json file with google spreadsheet API"+\
             "credentials must be provided."
         assert kws.get("url", None),"The google spreadsheet URL must be provided."
@@ -354,33 +560,27 @@ class read_data():
         print("loading worksheet...", end='')
         rows = gc.open_by_url(url).worksheet(sheet_name).get_all_values()
 
+        # get_all_values() pads every row to the sheet width and returns
+        # strings, so the rows go straight into polars
         n = kws.get("n_headers", 1)
-        dfh = pl.from_pandas(pd.DataFrame(rows[:n]))
-        df = pl.from_pandas(pd.DataFrame(rows[n:]))
+        schema = {f"c{i}": pl.String for i in range(len(rows[0]) if rows else 0)}
+        dfh = pl.DataFrame(rows[:n], schema=schema, orient='row')
+        df = pl.DataFrame(rows[n:], schema=schema, orient='row')
         df = read_data._apply_multiheader_from_frames(df, dfh, **kws)
 
         return df
 
     def get_accepted_file_formats(_print=False):
-        ACCEPTED_FILES = {
-            'csv-like'                : ['.csv', '.CSV', '.tsv','.TSV', '.dat', '.DAT', '.txt', '.TXT'],
-            'excel-like'              : ['.xls', '.xlsx', '.xlt', '.XLT', '.xltx', '.XLTX',
-                                         '.ods', '.ODS', '.XLS', '.XLSX'],
-            'R files'                 : ['.Rdata', '.rdata', '.rda', '.rds'],
-            'Stata files'             : ['.dta', '.DTA'],
-            'SPSS files'              : ['.sav'],
-            'URL'                     : ['URL with any of the supported file types'],
-            'Google Drive Spreadsheet': ['See documentation'],
-        }
         if _print:
             res = None
-            for file_types, extensions in ACCEPTED_FILES.items():
+            for file_types, extensions in _ACCEPTED_FILES.items():
                 exts = sorted(set([s.lower().replace(".", '') for s in extensions]))
                 print(f"- {file_types}: {', '.join(exts)}")
         else:
-            res = ACCEPTED_FILES
+            res = _ACCEPTED_FILES
         return res
     
+    @staticmethod
     def _combine_with_parens(levels: list[str], sep: str = ", ") -> str:
         # """
         # Combine levels into 'level1 (level2<sep>level3<sep>...)'.
@@ -447,101 +647,106 @@ class read_data():
         # """
         # df_data = df_data.to_polars()
         # df_header = df_header.to_polars()
-        combine = kws.get("header_combine_rule", None)
-
-        if combine is None:
-            combine = lambda levels: read_data._combine_with_parens(levels, sep=combine_parenthesis_sep)
-        elif combine == '_':
-            combine = lambda levels: "_".join(levels)
+        new_names = read_data._multiheader_names(df_header, combine,
+                                                 combine_parenthesis_sep,
+                                                 multi_col_sentinel, **kws)
 
-        # Turn header into a list-of-lists
-        header_rows = [list(row) for row in df_header.rows()]
-        n_levels = len(header_rows)
-        if n_levels == 0:
-            raise ValueError("df_header must have at least one row (a header level).")
-        n_cols = len(header_rows[0])
+        return read_data._with_names(df_data, new_names)
 
+    def _with_names(df_data: pl.DataFrame, new_names: list[str]):
         # Sanity check: match number of columns
-        if len(df_data.columns) != n_cols:
+        if len(df_data.columns) != len(new_names):
             raise ValueError(
-                f"df_data has {len(df_data.columns)} columns but df_header has {n_cols}."
+                f"df_data has {len(df_data.columns)} columns but df_header has {len(new_names)}."
             )
 
-        # 1) Forward-fill in all upper levels (except last)
-        for r in range(n_levels - 1):  # all levels except deepest
-            last_val = None
-            for c in range(n_cols):
-                val = header_rows[r][c]
+        # Rename df_data columns according to order
+        mapping = dict(zip(df_data.columns, new_names))
+        res = from_polars(df_data.rename(mapping))
+        return res
 
-                is_missing = (
-                    val is None
-                    or val == ""
-                    or (isinstance(val, str) and val == multi_col_sentinel)
-                )
+    def _xls_positions(cols, names):
+        # 0-based positions of cols (names or positions) in the
+        # flattened header; None selects every column
+        if cols is None:
+            return None
+        return [c if isinstance(c, int) else names.index(c) for c in cols]
+
+    def _xls_reorder(df, names, positions):
+        # readers return the selected columns in sheet order (they are
+        # read at sorted(positions)); put them and their names in the
+        # requested order
+        if positions is None:
+            return df, names
+        sel = sorted(positions)
+        return (df.select([df.columns[sel.index(i)] for i in positions]),
+                [names[i] for i in positions])
+
+    def _multiheader_names(df_header: pl.DataFrame,
+                           combine: Callable[[List[str]], str] | None = None,
+                           combine_parenthesis_sep = '; ',
+                           multi_col_sentinel: Any = "None",
+                           *args,
+                           **kws,
+                           ) -> list[str]:
+        # """
+        # Flattened column names for the header hierarchy df_header, one
+        # per column. See _apply_multiheader_from_frames for the rules.
+        # """
+        combine = kws.get("header_combine_rule", None)
 
-                if is_missing:
-                    header_rows[r][c] = last_val
-                else:
-                    last_val = str(val)
+        if combine is None:
+            combine = partial(read_data._combine_with_parens, sep=combine_parenthesis_sep)
+        elif combine == '_':
+            combine = "_".join
+
+        # Header as an (n_levels x n_cols) object array
+        header_rows = df_header.rows()
+        n_levels = len(header_rows)
+        if n_levels == 0:
+            raise ValueError("df_header must have at least one row (a header level).")
+        arr = np.empty((n_levels, len(header_rows[0])), dtype=object)
+        arr[:] = header_rows
+        n_cols = arr.shape[1]
+
+        # one hash probe per cell; the sentinel only matches strings
+        _MISSING = frozenset((None, "", multi_col_sentinel)
+                             if isinstance(multi_col_sentinel, str) else (None, ""))
+        missing = np.fromiter((val in _MISSING for val in arr.flat),
+                              dtype=bool, count=arr.size).reshape(arr.shape)
+
+        # 1) Forward-fill in all upper levels (except last): each cell takes
+        #    the value of the last non-missing cell at or before it
+        cols = np.arange(n_cols)
+        src = np.maximum.accumulate(np.where(missing[:-1], -1, cols), axis=1)
+        upper = np.take_along_axis(arr[:-1], np.maximum(src, 0), axis=1)
+        upper[src < 0] = None
+        arr[:-1] = upper
 
         # 2) Clean last level: treat sentinel as missing
-        last_idx = n_levels - 1
-        for c in range(n_cols):
-            val = header_rows[last_idx][c]
-            if (
-                val is None
-                or val == ""
-                or (isinstance(val, str) and val == multi_col_sentinel)
-            ):
-                header_rows[last_idx][c] = None
-            else:
-                header_rows[last_idx][c] = str(val)
+        arr[-1, missing[-1]] = None
 
         # --- NEW PART: compute cleaned levels & base counts ---
-
-        cleaned_levels_per_col: list[list[str]] = []
-        base_names: list[str | None] = []
-
-        for c in range(n_cols):
-            levels = [header_rows[r][c] for r in range(n_levels)]
-            levels_clean = [
-                str(x).strip()
-                for x in levels
-                if x is not None and str(x).strip() != ""
-            ]
-            cleaned_levels_per_col.append(levels_clean)
-            base_names.append(levels_clean[0] if levels_clean else None)
-
-        from collections import Counter
-        base_counts = Counter(b for b in base_names if b is not None)
+        cleaned_levels_per_col: list[list[str]] = [
+            [x for x in (str(v).strip() for v in col if v is not None) if x]
+            for col in arr.T
+        ]
+        base_names: list[str | None] = [
+            levels_clean[0] if levels_clean else None
+            for levels_clean in cleaned_levels_per_col
+        ]
+
+        bases = np.asarray(base_names, dtype=object)
+        uniq, cnt = np.unique(bases[bases != None].astype(str), return_counts=True)
+        counts_of = dict(zip(uniq.tolist(), cnt.tolist()))
 
         # 3) Build final column names
-        new_names: list[str] = []
-        for c in range(n_cols):
-            levels_clean = cleaned_levels_per_col[c]
-
-            if not levels_clean:
-                new_names.append(f"column_{c+1}")
-                continue
-
-            base = levels_clean[0]
-
-            # RULE: if this base appears in exactly one column,
-            # ignore lower levels and use only base.
-            if base is not None and base_counts.get(base, 0) == 1:
-                new_names.append(base)
-            else:
-                new_names.append(combine(levels_clean))
-
-        # 4) Rename df_data columns according to order
-        mapping = dict(zip(df_data.columns, new_names))
-        res = from_polars(df_data.rename(mapping))
-        return res
-
-class read_dask:
-         
-   def __new__():
-        print("To be implemented.")
-        #     # return eDask(fn, **kws)
-        #     return ddf.read_csv(fn, **kws)
-        return None
+        # RULE: if a base appears in exactly one column,
+        # ignore lower levels and use only base.
+        new_names: list[str] = [
+            f"column_{c+1}" if not levels_clean else
+            levels_clean[0] if counts_of[levels_clean[0]] == 1 else
+            combine(levels_clean)
+            for c, levels_clean in enumerate(cleaned_levels_per_col)
+        ]
+        return new_names
@@ -4,16 +4,19 @@ warnings.filterwarnings("ignore", category=UserWarning, module="rpy2.rinterface"
 
 from .io import DATA_LABELS
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+import copy
+import os
+import numpy as np
 import pandas as pd
 
 try:
     import rpy2.robjects as ro
-    from rpy2.robjects import pandas2ri, conversion, default_converter
+    from rpy2.robjects import pandas2ri, numpy2ri, conversion, default_converter
     from rpy2.rinterface_lib.embedded import RRuntimeError
-    from rpy2.rinterface_lib.sexp import NULLType
 except ImportError as exc:
     raise ImportError(
         "io_r.py requires 'rpy2'. Install it with:\n\n"
@@ -48,10 +51,6 @@ _SAFE_READRDS = R(
     """
 )
 
-def _is_null(x: Any) -> bool:
-    # """Return True if x is an R NULL or Python None."""
-    return x is None or isinstance(x, NULLType)
-
 def _load_r_dataframe(path: Path, obj_name: Optional[str] = None) -> ro.vectors.DataFrame:
     # """
     # Load an R data.frame from .rds or .RData.
@@ -144,13 +143,15 @@ def _r_label_extractor() -> ro.functions.SignatureTranslatedFunction:
     # """
     # Build (once) the small R function that extracts variable- and value-labels.
 
-    # It returns a list with:
+    # All labels come back as flat vectors, so they cross into Python in a
+    # fixed number of conversions regardless of the number of columns:
 
-    #   $var_labels   : named list of variable labels (or NULL)
-    #   $value_labels : named list; each element is either
-    #                   - NULL if no value labels, or
-    #                   - named character vector with names = codes, values = labels
-    #                     (code -> label mapping)
+    #   $var_label_keys   : names of the variables with a variable label
+    #   $var_label_values : their labels
+    #   $vl_keys          : names of the variables with value labels
+    #   $vl_codes         : codes of all value labels, concatenated by variable
+    #   $vl_labels        : matching labels (code -> label)
+    #   $vl_offsets       : cumulative number of codes per variable in vl_keys
     # """
     return R(
         """
@@ -158,13 +159,12 @@ def _r_label_extractor() -> ro.functions.SignatureTranslatedFunction:
           vars <- names(d)
 
           # Variable labels (attr(x, "label"))
-          var_labels <- lapply(d, function(x) {
+          var_labels <- vapply(d, function(x) {
             lbl <- attr(x, "label", exact = TRUE)
-            if (is.null(lbl)) return(NULL)
-            if (length(lbl) == 0 || is.na(lbl[1])) return(NULL)
+            if (is.null(lbl) || length(lbl) == 0 || is.na(lbl[1])) return(NA_character_)
             as.character(lbl[1])
-          })
-          names(var_labels) <- vars
+          }, character(1L), USE.NAMES = FALSE)
+          has_label <- !is.na(var_labels)
 
           # Value labels (attr(x, "labels"), e.g. haven::labelled)
           value_labels <- lapply(d, function(x) {
@@ -174,26 +174,30 @@ def _r_label_extractor() -> ro.functions.SignatureTranslatedFunction:
             # Remove NA codes if any
             labs <- labs[!is.na(labs)]
 
-            if (length(labs) == 0) return(NULL)
-
-            # haven::labelled: names(labs) = labels, values(labs) = codes
-            # We want mapping: code -> label
-            codes  <- as.character(unname(labs))
-            labels <- as.character(names(labs))
-            out <- setNames(labels, codes)  # names = codes, values = labels
-            out
+            if (length(labs) == 0 || is.null(names(labs))) return(NULL)
+            labs
           })
-          names(value_labels) <- vars
+          has_values <- !vapply(value_labels, is.null, logical(1L), USE.NAMES = FALSE)
+          value_labels <- value_labels[has_values]
 
+          # haven::labelled: names(labs) = labels, values(labs) = codes
+          # We want mapping: code -> label
           list(
-            var_labels   = var_labels,
-            value_labels = value_labels
+            var_label_keys   = as.character(vars[has_label]),
+            var_label_values = var_labels[has_label],
+            vl_keys    = as.character(vars[has_values]),
+            vl_codes   = as.character(unlist(lapply(value_labels, function(l) as.character(unname(l))),
+                                             use.names = FALSE)),
+            vl_labels  = as.character(unlist(lapply(value_labels, names), use.names = FALSE)),
+            vl_offsets = as.integer(cumsum(lengths(value_labels)))
           )
         }
         """
     )
 
 _LABEL_FUN = _r_label_extractor()
+_LABEL_FIELDS = ("var_label_keys", "var_label_values",
+                 "vl_keys", "vl_codes", "vl_labels", "vl_offsets")
 
 def _extract_labels(r_df: ro.vectors.DataFrame) -> DATA_LABELS:
     # """
@@ -202,68 +206,38 @@ def _extract_labels(r_df: ro.vectors.DataFrame) -> DATA_LABELS:
     # Only variables that actually have labels are included in the dicts.
     # """
     labels_r = _LABEL_FUN(r_df)
-
-    # R objects:
-    #   labels_r$var_labels   : named list of labels or NULL
-    #   labels_r$value_labels : named list of named vectors or NULL
-    var_labels_r = labels_r.rx2("var_labels")
-    value_labels_r = labels_r.rx2("value_labels")
+    with conversion.localconverter(default_converter + numpy2ri.converter):
+        flat = {field: conversion.rpy2py(labels_r.rx2(field)) for field in _LABEL_FIELDS}
 
     var_names = list(r_df.names)
 
-    # names() themselves can be NULL, so guard that too
-    if _is_null(var_labels_r):
-        var_label_names = set()
-    else:
-        vnames = var_labels_r.names
-        var_label_names = set([] if _is_null(vnames) else list(vnames))
-
-    if _is_null(value_labels_r):
-        value_label_names = set()
-    else:
-        vlnames = value_labels_r.names
-        value_label_names = set([] if _is_null(vlnames) else list(vlnames))
+    # ---------- VARIABLE LABELS ----------
+    variables: Dict[str, str] = {
+        str(var): vlabel
+        for var, vlabel in zip(flat["var_label_keys"], map(str, flat["var_label_values"]))
+        if vlabel.strip() and vlabel.lower() != "na"
+    }
 
-    variables: Dict[str, str] = {}
+    # ---------- VALUE LABELS ----------
     values: Dict[str, Dict[Any, str]] = {}
-
-    for var in var_names:
-        # ---------- VARIABLE LABELS ----------
-        if var in var_label_names and not _is_null(var_labels_r):
-            vlabel_vec = var_labels_r.rx2(var)
-            if _is_null(vlabel_vec):
-                pass
-            elif len(vlabel_vec) > 0:
-                vlabel = str(vlabel_vec[0])
-                if vlabel.strip() and vlabel.lower() != "na":
-                    variables[var] = vlabel
-
-        # ---------- VALUE LABELS ----------
-        if var in value_label_names and not _is_null(value_labels_r):
-            vlabels_vec = value_labels_r.rx2(var)
-            if _is_null(vlabels_vec) or len(vlabels_vec) == 0:
-                continue
-
-            vnames = vlabels_vec.names
-            if _is_null(vnames):
-                continue
-
-            # names(vlabels_vec) = codes, values = labels
-            codes = [str(c) for c in list(vnames)]
-            labs  = [str(x) for x in list(vlabels_vec)]
-            mapping = {
-                code: lab
-                for code, lab in zip(codes, labs)
-                if lab.strip()
-            }
-            if mapping:
-                values[var] = mapping
+    bounds = np.asarray(flat["vl_offsets"], dtype=np.intp)[:-1]
+    for var, codes, labs in zip(flat["vl_keys"],
+                                np.split(np.asarray(flat["vl_codes"]), bounds),
+                                np.split(np.asarray(flat["vl_labels"]), bounds)):
+        mapping = {
+            str(code): lab
+            for code, lab in zip(codes, map(str, labs))
+            if lab.strip()
+        }
+        if mapping:
+            values[str(var)] = mapping
 
     return DATA_LABELS(original=var_names, variables=variables, values=values)
 
 def load_r(
     path: str,
     obj_name: Optional[str] = None,
+    coerce_strings_to_factor: bool = False,
 ) -> Tuple[pd.DataFrame, DATA_LABELS]:
     # """
     # Load an R dataset (.rds or .RData) and extract labels.
@@ -275,6 +249,9 @@ def load_r(
     # obj_name:
     #     If reading from .RData, optional name of the object to load.
     #     If None, the first R data.frame in the file is used.
+    # coerce_strings_to_factor:
+    #     If True, convert character columns to R factors before the
+    #     conversion, so they arrive in pandas as categoricals.
 
     # Returns
     # -------
@@ -284,6 +261,23 @@ def load_r(
     #              - labels.variables: only vars with variable labels
     #              - labels.values   : only vars with value labels
     # """
+    abs_path = os.path.abspath(path)
+    data, labels = _load_r_cached(abs_path, os.stat(abs_path).st_mtime_ns,
+                                  obj_name, coerce_strings_to_factor)
+    # copies keep callers from mutating the cached entry
+    return data.copy(deep=False), copy.deepcopy(labels)
+
+@lru_cache(maxsize=8)
+def _load_r_cached(
+    path: str,
+    mtime_ns: int,
+    obj_name: Optional[str] = None,
+    coerce_strings_to_factor: bool = False,
+) -> Tuple[pd.DataFrame, DATA_LABELS]:
+    # """
+    # Cached worker for load_r. The file's mtime is part of the key, so
+    # a file rewritten on disk is read again.
+    # """
     path_obj = Path(path)
 
     r_df = _load_r_dataframe(path_obj, obj_name=obj_name)
@@ -291,12 +285,14 @@ def load_r(
     # 1) Extract labels from the ORIGINAL R data.frame
     labels = _extract_labels(r_df)
 
-    # 2) Coerce character columns to factors for safe Python conversion
-    r_df_for_py = _COERCE_CHAR_TO_FACTOR(r_df)
+    # 2) Optionally coerce character columns to factors (opt-in: it copies
+    #    every string column into a levels table before the conversion)
+    if coerce_strings_to_factor:
+        r_df = _COERCE_CHAR_TO_FACTOR(r_df)
 
-    # 3) Convert the coerced data.frame to pandas
+    # 3) Convert the data.frame to pandas
     with conversion.localconverter(default_converter + pandas2ri.converter):
-        data = conversion.rpy2py(r_df_for_py)
+        data = conversion.rpy2py(r_df)
 
     if not isinstance(data, pd.DataFrame):
         raise TypeError(
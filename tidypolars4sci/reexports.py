@@ -38,11 +38,11 @@ Date = pl.Date
 Datetime = pl.Datetime
 Object = pl.Object
 
-is_character = [pl.Utf8, pl.Enum, pl.Categorical]
+is_character = (pl.Utf8, pl.Enum, pl.Categorical)
 is_string = pl.Utf8
-is_factor = [pl.Enum, pl.Categorical]
+is_factor = (pl.Enum, pl.Categorical)
 is_ordered = pl.Enum
 is_unordered = pl.Categorical
-is_integer =  [pl.Int8, pl.Int16, pl.Int32, pl.Int64]
-is_float = [pl.Float32, pl.Float64]
-is_numeric = [pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.Float32, pl.Float64]
+is_integer =  (pl.Int8, pl.Int16, pl.Int32, pl.Int64)
+is_float = (pl.Float32, pl.Float64)
+is_numeric = (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.Float32, pl.Float64)
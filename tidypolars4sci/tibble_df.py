@@ -5,6 +5,7 @@ from .utils import (_as_list,
                     _col_exprs,
                     _kwargs_as_exprs,
                     _mutate_cols,
+                    _mutate_from_kwargs,
                     _uses_by,
                     _filter_kwargs_for,
                     _expand_to_full_path_or_url
@@ -505,14 +506,15 @@ class tibble(pl.DataFrame):
         ...           a_plus_b = col('a') + col('b'))
         >>> df.mutate(row_num = row_number(), by = 'c')
         """
-        exprs = _as_list(args) + _kwargs_as_exprs(kwargs)
-
         out = self.to_polars()
 
         if _uses_by(by):
+            exprs = _as_list(args) + _kwargs_as_exprs(kwargs)
             out = out.group_by(by).map_groups(lambda x: _mutate_cols(x, exprs))
+        elif args:
+            out = _mutate_cols(out, _as_list(args) + _kwargs_as_exprs(kwargs))
         else:
-            out = _mutate_cols(out, exprs)
+            out = _mutate_from_kwargs(out, kwargs)
             
         return out.pipe(from_polars)
 
@@ -1076,7 +1078,9 @@ class tibble(pl.DataFrame):
         >>> df.slice(0, 1)
         >>> df.slice(0, by = 'c')
         """
-        rows = _as_list(args)
+        # row positions given as a Series are used by value
+        rows = _as_list([arg.to_list() if isinstance(arg, pl.Series) else arg
+                         for arg in args])
         if _uses_by(by):
             df = super(tibble, self).group_by(by).map_groups(lambda x: x.select(pl.all().gather(rows)))
         else:
@@ -1,8 +1,7 @@
 import inspect
+import os
 import polars as pl
-import polars.selectors as cs
-from operator import not_
-from itertools import chain
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 from urllib.parse import urlparse
@@ -11,132 +10,261 @@ from urllib.request import url2pathname
 
 __all__ = []
 
+# exact-type checks against these are a pointer compare
+_EXPR = pl.Expr
+_SERIES = pl.Series
+# bound once to skip the polars module lookup on every call
+_LIT = pl.lit
+_COL = pl.col
+_CONST_TUPLE = (bool, int, float, str)
+_CONST_TYPES = frozenset(_CONST_TUPLE)
+try:
+    from polars.datatypes import DataTypeClass as _DTYPE_CLASS
+except ImportError:
+    _DTYPE_CLASS = None
+
 def _list_flatten(l):
-    l = [x if isinstance(x, list) else [x] for x in l]
-    return list(chain.from_iterable(l))
+    # one level deep; scalars are appended without a wrapper list
+    out = []
+    for x in l:
+        if type(x) is list:
+            out.extend(x)
+        else:
+            out.append(x)
+    return out
 
 def _as_list(x):
-    if type(x).__name__ == 'DataTypeClass':
-        out = [x]
-    elif _safe_len(x) == 0:
-        out = []
-    elif _is_series(x):
-        out = x.to_list()
-    elif _is_tuple(x):
-        # Helpful to convert args to a list
-        out = [val.to_list() if _is_series(val) else val for val in x]
+    # most frequent inputs first
+    t = type(x)
+    if t is str:
+        out = [x] if x else []
+    elif t is list:
         out = _list_flatten(x)
-    elif _is_list(x):
+    elif t is tuple:
+        # Helpful to convert args to a list. Series are kept whole:
+        # filter/arrange/mutate take them as columns, not as values
         out = _list_flatten(x)
-    else:
+    elif x is None:
+        out = []
+    elif t is _SERIES:
+        out = x.to_list()
+    elif _is_type(x) or len(x) != 0:
         out = [x]
+    else:
+        out = []
     return out
 
 # Convert kwargs to col() expressions with alias
 def _kwargs_as_exprs(kwargs):
-    return [_lit_expr(expr).alias(key) for key, expr in kwargs.items()]
+    return list(_iter_kwargs_exprs(kwargs))
+
+def _iter_kwargs_exprs(kwargs):
+    for key, expr in kwargs.items():
+        # expressions are aliased directly; anything else goes through pl.lit
+        if type(expr) is _EXPR or isinstance(expr, _EXPR):
+            yield expr.alias(key)
+        elif type(expr) in _LIT_CACHE_TYPES:
+            yield _cached_lit_alias(key, type(expr), expr)
+        else:
+            yield _LIT(expr).alias(key)
 
-def _safe_len(x):
-    if x == None:
-        return 0
-    else:
-        return len(x)
+# Expr objects are immutable, so the aliased literal built for a
+# (name, value) pair can be reused by later calls with the same pair.
+# The type is part of the key because 1 and True compare equal. Only
+# types whose equal values give identical literals are cached (not
+# float: 0.0 == -0.0; not Decimal: 1.0 == 1.00 with another scale).
+_LIT_CACHE_TYPES = frozenset((str, int, bool, type(None)))
+
+@lru_cache(maxsize=256)
+def _cached_lit_alias(key, type_, value):
+    return _LIT(value).alias(key)
 
 def _uses_by(by):
-    if _is_expr(by) | _is_string(by):
+    if _is_expr(by) or _is_string(by):
         return True
     elif isinstance(by, list):
         # Allow passing an empty list to `by`
-        if _safe_len(by) == 0:
-            return False
-        else:
-            return True
+        return len(by) != 0
     else:
         return False
 
 def _is_boolean(x):
-    return isinstance(x, bool)
+    # bool cannot be subclassed
+    return type(x) is bool
 
 def _is_constant(x):
-    return _is_boolean(x) | _is_float(x) | _is_integer(x) | _is_string(x)
+    # numpy scalars such as numpy.float64 subclass the builtins
+    return type(x) in _CONST_TYPES or isinstance(x, _CONST_TUPLE)
 
 def _is_expr(x):
-    return isinstance(x, pl.Expr)
+    # selectors and DescCol subclass pl.Expr
+    return type(x) is _EXPR or isinstance(x, _EXPR)
 
 def _is_float(x):
-    return isinstance(x, float)
+    # numpy.float64 subclasses float
+    return type(x) is float or isinstance(x, float)
 
 def _is_integer(x):
-    return isinstance(x, int)
+    return type(x) is int or isinstance(x, int)
 
 def _is_iterable(x):
-    return hasattr(x, '__iter__') & not_(_is_string(x))
+    return hasattr(x, '__iter__') and not _is_string(x)
 
 def _is_list(x):
-    return isinstance(x, list)
+    return type(x) is list
 
 def _is_series(x):
-    return isinstance(x, pl.Series)
+    return type(x) is _SERIES
 
 def _is_string(x):
-    return isinstance(x, str)
+    # numpy.str_ subclasses str
+    return type(x) is str or isinstance(x, str)
 
 def _is_tuple(x):
-    return isinstance(x, tuple)
-
-def _is_type(x):
-    return type(x).__name__ == 'DataTypeClass'
+    return type(x) is tuple
 
-def _lit_expr(x):
-    if not_(_is_expr(x)):
-        x = pl.lit(x)
-    return x
+if _DTYPE_CLASS is not None:
+    def _is_type(x):
+        return type(x) is _DTYPE_CLASS
+else:
+    def _is_type(x):
+        return type(x).__name__ == 'DataTypeClass'
 
 #  Wrap all str inputs in col()  
 def _col_exprs(x):
-    if _is_list(x) | _is_series(x):
+    if _is_list(x) or _is_series(x):
         return [_col_expr(val) for val in x]
     else:
         return [_col_expr(x)]
 
+def _identity(x):
+    return x
+
+# handlers for the exact types seen most often; anything else
+# (subclasses, selectors, dtypes) goes through the checks below
+_COL_DISPATCH = {
+    str: _COL,
+    _EXPR: _identity,
+    _SERIES: _identity,
+}
+
+@lru_cache(maxsize=None)
+def _selector_class():
+    # imported on first use; only reached for inputs that are not
+    # already matched as str/Expr/Series
+    try:
+        from polars.selectors import Selector
+    except ImportError:
+        # polars < 1.0
+        from polars.selectors import _selector_proxy_ as Selector
+    return Selector
+
 def _col_expr(x):
-    if _is_expr(x) | _is_series(x) | cs.is_selector(x):
+    handler = _COL_DISPATCH.get(type(x))
+    if handler is not None:
+        return handler(x)
+    elif _is_expr(x) or isinstance(x, _selector_class()):
+        # selectors subclass pl.Expr, so the second check rarely runs
         return x
-    elif _is_string(x) | _is_type(x):
-        return pl.col(x)
+    elif _is_string(x) or _is_type(x):
+        return _COL(x)
     else:
        raise ValueError("Invalid input for column selection") 
 
 def _repeat(x, times):
-    if not_(_is_list(x)):
+    if not _is_list(x):
         x = [x]
     return x * times
 
 def _mutate_cols(df, exprs):
+    # Expressions are applied in batches of one with_columns (a single
+    # projection) each. mutate lets later expressions use the results of
+    # earlier ones, so a new batch starts when an expression reads or
+    # rewrites a column produced in the current batch. Expressions whose
+    # inputs or outputs are not plain named columns (selectors, regex,
+    # pl.all, ...) run on their own.
+    batch, outputs = [], set()
     for expr in exprs:
-        df = df.with_columns(expr)
-    return df
+        try:
+            out = expr.meta.output_name()
+            roots = expr.meta.root_names()
+            # any wildcard/exclude/regex/dtype/nth/selector input in the
+            # tree makes this true, even below an alias or pl.struct
+            if expr.meta.has_multiple_outputs():
+                out = None
+        except (AttributeError, pl.exceptions.PolarsError):
+            out = None
+        if out is None or out in outputs or not outputs.isdisjoint(roots):
+            if batch:
+                df = df.with_columns(*batch)
+            batch, outputs = [], set()
+        if out is None:
+            df = df.with_columns(expr)
+        else:
+            batch.append(expr)
+            outputs.add(out)
+    return df.with_columns(*batch) if batch else df
+
+def _mutate_from_kwargs(df, kwargs):
+    # kwargs-only mutate: the aliased expressions are streamed into
+    # _mutate_cols, which keeps the batching and the ordering rules
+    return _mutate_cols(df, _iter_kwargs_exprs(kwargs))
 
 def _str_to_lit(x):
     if _is_string(x):
-        x = pl.lit(x)
+        x = _LIT(x)
     return x
 
+def _sig_params(func):
+    # plain functions and methods: read the names off the code object,
+    # which is much cheaper than building an inspect.Signature. Wrapped
+    # callables (functools.wraps) report the wrapper's code, so they and
+    # callables without __code__ go through inspect
+    code = getattr(func, '__code__', None)
+    if code is None or hasattr(func, '__wrapped__'):
+        return frozenset(inspect.signature(func).parameters)
+    names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+    if getattr(func, '__self__', None) is not None:
+        # bound method; drop self
+        names = names[1:]
+    return frozenset(names)
+
+# signatures don't change, so each callable is inspected only once;
+# bounded because callers may pass short-lived callables
+_cached_sig_params = lru_cache(maxsize=256)(_sig_params)
+
+def _allowed_params(func):
+    try:
+        return _cached_sig_params(func)
+    except TypeError:
+        # unhashable callable
+        return _sig_params(func)
+
 def _filter_kwargs_for(func, kwargs):
-    sig = inspect.signature(func)
-    allowed = sig.parameters.keys()
+    allowed = _allowed_params(func)
     return {k: v for k, v in kwargs.items() if k in allowed}
 
+_URL_SCHEMES = ("http://", "https://", "s3://", "gs://", "azure://", "ftp://")
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(s: str, cwd: str) -> str:
+    # """
+    # Expanded absolute path of `s`. `cwd` is only part of the cache key,
+    # so relative paths are resolved again after a change of directory.
+    # Use _resolve_cached.cache_clear() if the filesystem changed.
+    # """
+    return str(Path(s).expanduser().resolve())
+
+def _resolve(p: Union[str, Path]) -> str:
+    return _resolve_cached(str(p), os.getcwd())
+
 def _expand_to_full_path(p: Union[str, Path]) -> str:
     # """
     # Convert a relative path, '~' path, or Path object
     # into a fully expanded absolute string path.
     # """
-    # Ensure it is a Path object
-    p = Path(p)
-
     # Expand home (~) and get absolute path
-    return str(p.expanduser().resolve())
+    return _resolve(p)
 
 def _expand_to_full_path_or_url(p: Union[str, Path]) -> str:
     # """
@@ -153,23 +281,29 @@ def _expand_to_full_path_or_url(p: Union[str, Path]) -> str:
 
     # If it's already a Path, we know it's a filesystem path, not a URL
     if isinstance(p, Path):
-        return str(p.expanduser().resolve())
+        return _resolve(p)
 
     # Otherwise, it's a string: might be URL or path
     s = str(p)
 
+    # Common prefixes are matched directly
+    if s.startswith(_URL_SCHEMES):
+        return s
+    if s.startswith("file:///") and "?" not in s and "#" not in s:
+        # nothing for urlparse to strip; the rest is the path
+        return _resolve(url2pathname(s[7:]))
+
     # Quick check: treat strings containing '://' as potential URLs
     if "://" in s:
         parsed = urlparse(s)
 
         # file:// URL -> convert to local path
         if parsed.scheme == "file":
-            local_path = url2pathname(parsed.path)
-            return str(Path(local_path).expanduser().resolve())
+            return _resolve(url2pathname(parsed.path))
 
         # Other URL schemes (http, https, s3, etc.) -> return unchanged
         if parsed.scheme:
             return s
 
     # Otherwise, treat it as a normal filesystem path
-    return str(Path(s).expanduser().resolve())
+    return _resolve(s)